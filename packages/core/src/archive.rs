@@ -3,12 +3,13 @@
 //! Manages the archive layer (`.rstn/archive/`) which stores
 //! completed changes for historical reference.
 
+use crate::fs_util::entry_is_dir;
 use std::path::Path;
 
 /// Check if archive directory exists
 pub fn archive_exists(project_path: &Path) -> bool {
     let archive_dir = project_path.join(".rstn").join("archive");
-    archive_dir.exists() && archive_dir.is_dir()
+    archive_dir.is_dir()
 }
 
 /// List all archived changes
@@ -16,13 +17,9 @@ pub fn list_archived_changes(project_path: &Path) -> Vec<String> {
     let archive_dir = project_path.join(".rstn").join("archive");
     let mut changes = Vec::new();
 
-    if !archive_dir.exists() || !archive_dir.is_dir() {
-        return changes;
-    }
-
     if let Ok(entries) = std::fs::read_dir(&archive_dir) {
         for entry in entries.flatten() {
-            if entry.path().is_dir() {
+            if entry_is_dir(&entry) {
                 if let Some(name) = entry.file_name().to_str() {
                     changes.push(name.to_string());
                 }
@@ -164,6 +161,36 @@ mod tests {
         assert_eq!(changes[2], "fix-bug-123");
     }
 
+    #[test]
+    fn test_list_archived_changes_skips_files() {
+        let temp_dir = TempDir::new().unwrap();
+        let archive_dir = temp_dir.path().join(".rstn").join("archive");
+
+        std::fs::create_dir_all(archive_dir.join("feature-auth")).unwrap();
+        std::fs::write(archive_dir.join(".DS_Store"), "").unwrap();
+
+        let changes = list_archived_changes(temp_dir.path());
+        assert_eq!(changes, vec!["feature-auth".to_string()]);
+    }
+
+    #[cfg(unix)]
+    #[test]
+    fn test_list_archived_changes_follows_dir_symlinks() {
+        let temp_dir = TempDir::new().unwrap();
+        let archive_dir = temp_dir.path().join(".rstn").join("archive");
+        let outside = temp_dir.path().join("outside");
+
+        std::fs::create_dir_all(&archive_dir).unwrap();
+        std::fs::create_dir_all(&outside).unwrap();
+        std::fs::write(outside.join("notes.md"), "").unwrap();
+        std::os::unix::fs::symlink(&outside, archive_dir.join("linked-change")).unwrap();
+        std::os::unix::fs::symlink(outside.join("notes.md"), archive_dir.join("notes.md"))
+            .unwrap();
+
+        let changes = list_archived_changes(temp_dir.path());
+        assert_eq!(changes, vec!["linked-change".to_string()]);
+    }
+
     #[tokio::test]
     async fn test_archive_change() {
         let temp_dir = TempDir::new().unwrap();
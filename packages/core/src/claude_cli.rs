@@ -19,6 +19,7 @@
 
 use serde::Deserialize;
 use std::path::Path;
+use std::sync::atomic::{AtomicBool, Ordering};
 use std::time::Duration;
 use tokio::io::{AsyncBufReadExt, BufReader};
 use tokio::process::{Child, Command};
@@ -33,6 +34,9 @@ pub const EVENT_TIMEOUT: Duration = Duration::from_secs(30);
 /// Maximum total time for a single request
 pub const TOTAL_TIMEOUT: Duration = Duration::from_secs(300);
 
+/// Grace period for the CLI to exit on its own once we stop reading events
+pub const EXIT_GRACE: Duration = Duration::from_secs(5);
+
 // ============================================================================
 // JSONL Event Types
 // ============================================================================
@@ -263,29 +267,55 @@ pub fn is_message_stop(event: &ClaudeStreamEvent) -> bool {
 // CLI Process Management
 // ============================================================================
 
+/// Set once `claude --version` has run successfully in this process.
+///
+/// The probe costs a full Node.js startup, so it is only paid until the CLI
+/// has been seen once. If the binary disappears afterwards, `spawn_claude`
+/// still reports `ClaudeCliError::NotFound`.
+static CLAUDE_VERIFIED: AtomicBool = AtomicBool::new(false);
+
 /// Check if Claude CLI is available on the system (async version).
 pub async fn is_claude_available() -> bool {
-    Command::new("claude")
+    if CLAUDE_VERIFIED.load(Ordering::Relaxed) {
+        return true;
+    }
+
+    let available = Command::new("claude")
         .arg("--version")
         .stdout(std::process::Stdio::null())
         .stderr(std::process::Stdio::null())
         .status()
         .await
         .map(|s| s.success())
-        .unwrap_or(false)
+        .unwrap_or(false);
+
+    if available {
+        CLAUDE_VERIFIED.store(true, Ordering::Relaxed);
+    }
+    available
 }
 
 /// Validate that Claude CLI is available, returning an error if not (async version).
 ///
 /// This should be called before attempting to spawn Claude CLI.
+/// Only the first successful check spawns `claude --version`.
 pub async fn validate_claude_cli() -> Result<(), ClaudeCliError> {
-    Command::new("claude")
+    if CLAUDE_VERIFIED.load(Ordering::Relaxed) {
+        return Ok(());
+    }
+
+    let status = Command::new("claude")
         .arg("--version")
         .stdout(std::process::Stdio::null())
         .stderr(std::process::Stdio::null())
         .status()
         .await
         .map_err(|_| ClaudeCliError::NotFound)?;
+
+    // A binary that runs but fails `--version` is probed again next time
+    if status.success() {
+        CLAUDE_VERIFIED.store(true, Ordering::Relaxed);
+    }
     Ok(())
 }
 
@@ -338,6 +368,7 @@ pub fn spawn_claude(
         .current_dir(cwd)
         .stdout(std::process::Stdio::piped())
         .stderr(std::process::Stdio::piped())
+        .kill_on_drop(true)
         .spawn()
         .map_err(|e| {
             if e.kind() == std::io::ErrorKind::NotFound {
@@ -348,6 +379,17 @@ pub fn spawn_claude(
         })
 }
 
+/// Reap a Claude CLI process after its event stream has been consumed.
+///
+/// Waits up to `EXIT_GRACE` for a normal exit, then kills the process.
+/// Without this, a CLI that hung past `EVENT_TIMEOUT` / `TOTAL_TIMEOUT`
+/// would keep running (and billing) after we gave up on it.
+pub async fn reap_claude(child: &mut Child) {
+    if tokio::time::timeout(EXIT_GRACE, child.wait()).await.is_err() {
+        let _ = child.kill().await;
+    }
+}
+
 /// Async iterator over JSONL events from a Claude CLI process.
 pub struct ClaudeEventStream {
     reader: BufReader<tokio::process::ChildStdout>,
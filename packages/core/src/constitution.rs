@@ -3,7 +3,6 @@
 //! Supports the KB-First architecture with `.rstn/constitutions/` directory
 //! containing multiple rule files with frontmatter metadata.
 
-use std::collections::HashSet;
 use std::path::Path;
 
 /// Default global constitution template
@@ -237,6 +236,13 @@ pub struct DetectedLanguages {
     pub has_react: bool,
 }
 
+impl DetectedLanguages {
+    /// Whether every tracked language has been found
+    fn all_detected(&self) -> bool {
+        self.has_rust && self.has_typescript && self.has_python && self.has_react
+    }
+}
+
 /// Check if a directory should be skipped during scanning
 fn should_skip_dir(name: &str) -> bool {
     name.starts_with('.')
@@ -251,7 +257,6 @@ fn should_skip_dir(name: &str) -> bool {
 /// Scan a directory for language-specific files
 pub fn detect_languages(project_path: &Path) -> DetectedLanguages {
     let mut result = DetectedLanguages::default();
-    let mut extensions_found: HashSet<String> = HashSet::new();
 
     // Walk directory (limited depth to avoid performance issues)
     let walker = walkdir::WalkDir::new(project_path)
@@ -269,19 +274,34 @@ pub fn detect_languages(project_path: &Path) -> DetectedLanguages {
         });
 
     for entry in walker.filter_map(|e| e.ok()) {
-        // Collect file extensions
-        if entry.file_type().is_file() {
-            if let Some(ext) = entry.path().extension() {
-                extensions_found.insert(ext.to_string_lossy().to_lowercase());
-            }
+        if !entry.file_type().is_file() {
+            continue;
         }
-    }
 
-    // Detect languages based on extensions
-    result.has_rust = extensions_found.contains("rs");
-    result.has_typescript = extensions_found.contains("ts") || extensions_found.contains("tsx");
-    result.has_python = extensions_found.contains("py");
-    result.has_react = extensions_found.contains("tsx") || extensions_found.contains("jsx");
+        // Detect languages based on extensions, compared case-insensitively
+        // in place rather than lowercasing a copy of every extension
+        let ext = match entry.path().extension().and_then(|ext| ext.to_str()) {
+            Some(ext) => ext,
+            None => continue,
+        };
+        if ext.eq_ignore_ascii_case("rs") {
+            result.has_rust = true;
+        } else if ext.eq_ignore_ascii_case("ts") {
+            result.has_typescript = true;
+        } else if ext.eq_ignore_ascii_case("tsx") {
+            result.has_typescript = true;
+            result.has_react = true;
+        } else if ext.eq_ignore_ascii_case("jsx") {
+            result.has_react = true;
+        } else if ext.eq_ignore_ascii_case("py") {
+            result.has_python = true;
+        }
+
+        // Nothing left to learn once every language has been seen
+        if result.all_detected() {
+            break;
+        }
+    }
 
     result
 }
@@ -292,7 +312,7 @@ pub fn constitution_exists(project_path: &Path) -> bool {
 
     // Check for modular constitution (new system)
     let constitutions_dir = rstn_dir.join("constitutions");
-    if constitutions_dir.exists() && constitutions_dir.is_dir() {
+    if constitutions_dir.is_dir() {
         // Check if there's at least one .md file
         if let Ok(entries) = std::fs::read_dir(&constitutions_dir) {
             for entry in entries.flatten() {
@@ -330,7 +350,7 @@ pub fn read_constitution(project_path: &Path) -> Option<String> {
 
     // Try modular constitution first (new system)
     let constitutions_dir = rstn_dir.join("constitutions");
-    if constitutions_dir.exists() && constitutions_dir.is_dir() {
+    if constitutions_dir.is_dir() {
         let mut contents: Vec<(i32, String, String)> = Vec::new(); // (priority, name, content)
 
         if let Ok(entries) = std::fs::read_dir(&constitutions_dir) {
@@ -351,8 +371,9 @@ pub fn read_constitution(project_path: &Path) -> Option<String> {
         }
 
         if !contents.is_empty() {
-            // Sort by priority (higher first)
-            contents.sort_by(|a, b| b.0.cmp(&a.0));
+            // Sort by priority (higher first), then by name so equal-priority
+            // files keep a stable order regardless of read_dir order
+            contents.sort_by(|a, b| b.0.cmp(&a.0).then_with(|| a.1.cmp(&b.1)));
 
             // Combine all constitution files
             let combined = contents
@@ -503,6 +524,30 @@ mod tests {
         assert!(detected.has_python);
     }
 
+    #[test]
+    fn test_detect_languages_all() {
+        let temp_dir = TempDir::new().unwrap();
+        for name in ["main.rs", "App.tsx", "script.py", "extra.ts", "more.rs"] {
+            std::fs::write(temp_dir.path().join(name), "").unwrap();
+        }
+
+        let detected = detect_languages(temp_dir.path());
+        assert!(detected.all_detected());
+    }
+
+    #[test]
+    fn test_detect_languages_extension_case_insensitive() {
+        let temp_dir = TempDir::new().unwrap();
+        std::fs::write(temp_dir.path().join("MAIN.RS"), "fn main() {}").unwrap();
+        std::fs::write(temp_dir.path().join("Widget.JSX"), "export {}").unwrap();
+
+        let detected = detect_languages(temp_dir.path());
+        assert!(detected.has_rust);
+        assert!(detected.has_react);
+        assert!(!detected.has_typescript);
+        assert!(!detected.has_python);
+    }
+
     #[test]
     fn test_constitution_exists_none() {
         let temp_dir = TempDir::new().unwrap();
@@ -596,6 +641,30 @@ mod tests {
         assert!(global_pos < rust_pos);
     }
 
+    #[test]
+    fn test_read_constitution_equal_priority_ordered_by_name() {
+        let temp_dir = TempDir::new().unwrap();
+        let constitutions_dir = temp_dir.path().join(".rstn").join("constitutions");
+        std::fs::create_dir_all(&constitutions_dir).unwrap();
+
+        std::fs::write(
+            constitutions_dir.join("typescript.md"),
+            "# TypeScript Rules",
+        )
+        .unwrap();
+        std::fs::write(constitutions_dir.join("python.md"), "# Python Rules").unwrap();
+        std::fs::write(constitutions_dir.join("rust.md"), "# Rust Rules").unwrap();
+
+        let content = read_constitution(temp_dir.path()).unwrap();
+
+        // All default to priority 50, so order falls back to file name
+        let python_pos = content.find("Python Rules").unwrap();
+        let rust_pos = content.find("Rust Rules").unwrap();
+        let typescript_pos = content.find("TypeScript Rules").unwrap();
+        assert!(python_pos < rust_pos);
+        assert!(rust_pos < typescript_pos);
+    }
+
     #[test]
     fn test_extract_priority() {
         assert_eq!(extract_priority("---\npriority: 100\n---\ncontent"), 100);
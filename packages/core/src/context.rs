@@ -122,7 +122,7 @@ token_estimate: 300
 /// Check if context directory exists and has files
 pub fn context_exists(project_path: &Path) -> bool {
     let context_dir = project_path.join(".rstn").join("context");
-    if !context_dir.exists() || !context_dir.is_dir() {
+    if !context_dir.is_dir() {
         return false;
     }
 
@@ -145,7 +145,7 @@ pub fn read_context(project_path: &Path) -> Vec<ContextFile> {
     let context_dir = project_path.join(".rstn").join("context");
     let mut files = Vec::new();
 
-    if !context_dir.exists() || !context_dir.is_dir() {
+    if !context_dir.is_dir() {
         return files;
     }
 
@@ -165,8 +165,7 @@ pub fn read_context(project_path: &Path) -> Vec<ContextFile> {
                         .unwrap_or_default();
 
                     let context_type = ContextType::from_filename(&filename);
-                    let last_updated = extract_last_updated(&content);
-                    let token_estimate = extract_token_estimate(&content);
+                    let (last_updated, token_estimate) = extract_frontmatter_meta(&content);
 
                     files.push(ContextFile {
                         name,
@@ -181,11 +180,12 @@ pub fn read_context(project_path: &Path) -> Vec<ContextFile> {
         }
     }
 
-    // Sort by context type for consistent ordering
-    files.sort_by(|a, b| {
-        let a_order = context_type_order(&a.context_type);
-        let b_order = context_type_order(&b.context_type);
-        a_order.cmp(&b_order)
+    // Sort by context type, then name, for consistent ordering (read_dir
+    // order is arbitrary, so ties need a key; with one, unstable sort is fine)
+    files.sort_unstable_by(|a, b| {
+        context_type_order(&a.context_type)
+            .cmp(&context_type_order(&b.context_type))
+            .then_with(|| a.name.cmp(&b.name))
     });
 
     files
@@ -220,38 +220,40 @@ pub fn read_context_combined(project_path: &Path) -> Option<String> {
     Some(combined)
 }
 
-/// Extract last_updated from YAML frontmatter
-fn extract_last_updated(content: &str) -> String {
-    if let Some(stripped) = content.strip_prefix("---") {
-        if let Some(end_idx) = stripped.find("---") {
-            let frontmatter = &stripped[..end_idx];
-            for line in frontmatter.lines() {
-                let line = line.trim();
-                if let Some(value) = line.strip_prefix("last_updated:") {
-                    return value.trim().trim_matches('"').to_string();
-                }
-            }
-        }
-    }
-    String::new()
-}
+/// Extract `last_updated` and `token_estimate` from YAML frontmatter.
+///
+/// Both fields come from a single scan that stops once each has been seen.
+/// Missing fields fall back to an empty timestamp and a 300-token estimate.
+fn extract_frontmatter_meta(content: &str) -> (String, u32) {
+    let mut last_updated = None;
+    let mut token_estimate = None;
 
-/// Extract token_estimate from YAML frontmatter
-fn extract_token_estimate(content: &str) -> u32 {
     if let Some(stripped) = content.strip_prefix("---") {
         if let Some(end_idx) = stripped.find("---") {
             let frontmatter = &stripped[..end_idx];
             for line in frontmatter.lines() {
                 let line = line.trim();
-                if let Some(value) = line.strip_prefix("token_estimate:") {
-                    if let Ok(estimate) = value.trim().parse::<u32>() {
-                        return estimate;
+                if last_updated.is_none() {
+                    if let Some(value) = line.strip_prefix("last_updated:") {
+                        last_updated = Some(value.trim().trim_matches('"').to_string());
                     }
                 }
+                if token_estimate.is_none() {
+                    if let Some(value) = line.strip_prefix("token_estimate:") {
+                        token_estimate = value.trim().parse::<u32>().ok();
+                    }
+                }
+                if last_updated.is_some() && token_estimate.is_some() {
+                    break;
+                }
             }
         }
     }
-    300 // Default estimate
+
+    (
+        last_updated.unwrap_or_default(),
+        token_estimate.unwrap_or(300), // Default estimate
+    )
 }
 
 /// Initialize context directory with default templates
@@ -403,25 +405,51 @@ mod tests {
         assert_eq!(files[1].name, "tech-stack");
     }
 
+    #[test]
+    fn test_read_context_custom_files_ordered_by_name() {
+        let temp_dir = TempDir::new().unwrap();
+        let context_dir = temp_dir.path().join(".rstn").join("context");
+        std::fs::create_dir_all(&context_dir).unwrap();
+
+        std::fs::write(context_dir.join("zeta-notes.md"), "zeta").unwrap();
+        std::fs::write(context_dir.join("alpha-notes.md"), "alpha").unwrap();
+        std::fs::write(context_dir.join("product.md"), PRODUCT_TEMPLATE).unwrap();
+
+        let names: Vec<String> = read_context(temp_dir.path())
+            .into_iter()
+            .map(|f| f.name)
+            .collect();
+        assert_eq!(names, vec!["product", "alpha-notes", "zeta-notes"]);
+    }
+
     #[test]
     fn test_extract_token_estimate() {
         let content = "---\ntoken_estimate: 500\n---\ncontent";
-        assert_eq!(extract_token_estimate(content), 500);
+        assert_eq!(extract_frontmatter_meta(content).1, 500);
 
         let content_no_estimate = "---\nname: test\n---\ncontent";
-        assert_eq!(extract_token_estimate(content_no_estimate), 300); // default
+        assert_eq!(extract_frontmatter_meta(content_no_estimate).1, 300); // default
 
         let no_frontmatter = "just content";
-        assert_eq!(extract_token_estimate(no_frontmatter), 300); // default
+        assert_eq!(extract_frontmatter_meta(no_frontmatter).1, 300); // default
     }
 
     #[test]
     fn test_extract_last_updated() {
         let content = "---\nlast_updated: \"2025-01-01\"\n---\ncontent";
-        assert_eq!(extract_last_updated(content), "2025-01-01");
+        assert_eq!(extract_frontmatter_meta(content).0, "2025-01-01");
 
         let content_no_date = "---\nname: test\n---\ncontent";
-        assert_eq!(extract_last_updated(content_no_date), "");
+        assert_eq!(extract_frontmatter_meta(content_no_date).0, "");
+    }
+
+    #[test]
+    fn test_extract_frontmatter_meta_both_fields() {
+        let content = "---\ntoken_estimate: 450\nname: test\nlast_updated: \"2025-02-03\"\n---\ncontent";
+        assert_eq!(
+            extract_frontmatter_meta(content),
+            ("2025-02-03".to_string(), 450)
+        );
     }
 
     #[tokio::test]
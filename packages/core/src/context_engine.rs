@@ -4,8 +4,9 @@
 //! from the project state to send to the LLM.
 
 use serde::{Deserialize, Serialize};
-use std::path::Path;
-use std::process::Command;
+use std::ffi::OsString;
+use std::path::{Path, PathBuf};
+use std::process::{Child, Command, Stdio};
 
 // ============================================================================
 // Core Types
@@ -167,8 +168,13 @@ impl ContextGatherer for GitGatherer {
     }
 
     fn gather(&self, project_path: &Path) -> GatheredContext {
-        let status = get_git_status(project_path);
-        let diff = get_git_diff(project_path);
+        // Status and diff are independent, so start both git processes
+        // before waiting on either of them.
+        let status_child = spawn_git(project_path, &["status", "--short", "--branch"]);
+        let diff_child = spawn_git(project_path, &["diff", "--stat"]);
+
+        let status = git_stdout(status_child);
+        let diff = truncate_git_diff(git_stdout(diff_child));
 
         let combined = format!("{}\n\n{}", status, diff);
         let tokens = combined.len() / 4;
@@ -181,14 +187,19 @@ impl ContextGatherer for GitGatherer {
     }
 }
 
-/// Get git status for a project.
-fn get_git_status(project_path: &Path) -> String {
-    let output = Command::new("git")
-        .args(["status", "--short", "--branch"])
+/// Start a git command in the project directory with stdout captured.
+fn spawn_git(project_path: &Path, args: &[&str]) -> std::io::Result<Child> {
+    Command::new("git")
+        .args(args)
         .current_dir(project_path)
-        .output();
+        .stdout(Stdio::piped())
+        .stderr(Stdio::null())
+        .spawn()
+}
 
-    match output {
+/// Wait for a git command and return its trimmed stdout (empty on failure).
+fn git_stdout(child: std::io::Result<Child>) -> String {
+    match child.and_then(|c| c.wait_with_output()) {
         Ok(out) if out.status.success() => {
             String::from_utf8_lossy(&out.stdout).trim().to_string()
         }
@@ -196,25 +207,31 @@ fn get_git_status(project_path: &Path) -> String {
     }
 }
 
-/// Get git diff (unstaged changes).
-fn get_git_diff(project_path: &Path) -> String {
-    let output = Command::new("git")
-        .args(["diff", "--stat"])
-        .current_dir(project_path)
-        .output();
+/// Maximum size (in bytes) of the git diff kept in the context
+const MAX_GIT_DIFF_LEN: usize = 2000;
 
-    match output {
-        Ok(out) if out.status.success() => {
-            let diff = String::from_utf8_lossy(&out.stdout).trim().to_string();
-            // Limit diff size to prevent token explosion
-            if diff.len() > 2000 {
-                format!("{}...\n(truncated)", &diff[..2000])
-            } else {
-                diff
-            }
-        }
-        _ => String::new(),
+/// Largest byte index `<= max` that lies on a char boundary of `s`.
+pub(crate) fn floor_char_boundary(s: &str, max: usize) -> usize {
+    if max >= s.len() {
+        return s.len();
     }
+    let mut end = max;
+    while !s.is_char_boundary(end) {
+        end -= 1;
+    }
+    end
+}
+
+/// Limit git diff (unstaged changes) size to prevent token explosion.
+///
+/// Truncates in place on a char boundary, so the diff is not copied again.
+fn truncate_git_diff(mut diff: String) -> String {
+    if diff.len() > MAX_GIT_DIFF_LEN {
+        let end = floor_char_boundary(&diff, MAX_GIT_DIFF_LEN);
+        diff.truncate(end);
+        diff.push_str("...\n(truncated)");
+    }
+    diff
 }
 
 // ============================================================================
@@ -248,12 +265,12 @@ impl ContextGatherer for FileGatherer {
         let mut total_tokens = 0;
 
         for path in &self.file_paths {
-            if let Ok(content) = std::fs::read_to_string(path) {
-                let truncated = if content.len() > self.max_file_size {
+            if let Some((content, total_len)) = read_file_prefix(path, self.max_file_size) {
+                let truncated = if total_len > self.max_file_size as u64 {
                     format!(
                         "{}...\n(truncated, {} more chars)",
-                        &content[..self.max_file_size],
-                        content.len() - self.max_file_size
+                        content,
+                        total_len - content.len() as u64
                     )
                 } else {
                     content
@@ -277,6 +294,36 @@ impl ContextGatherer for FileGatherer {
     }
 }
 
+/// Read at most `max_len` bytes of a UTF-8 text file.
+///
+/// Returns the text and the file's total size in bytes, so large files are
+/// never loaded in full just to be cut down. A multi-byte character split by
+/// the limit is dropped. Returns None if the file cannot be read or is not
+/// valid UTF-8.
+fn read_file_prefix(path: &str, max_len: usize) -> Option<(String, u64)> {
+    use std::io::Read;
+
+    let file = std::fs::File::open(path).ok()?;
+    let total_len = file.metadata().ok()?.len();
+
+    let mut buf = Vec::with_capacity(total_len.min(max_len as u64) as usize);
+    file.take(max_len as u64).read_to_end(&mut buf).ok()?;
+
+    match String::from_utf8(buf) {
+        Ok(text) => Some((text, total_len)),
+        Err(e) => {
+            // Only an incomplete character at the cut point is acceptable
+            let utf8_error = e.utf8_error();
+            if utf8_error.error_len().is_some() || total_len <= max_len as u64 {
+                return None;
+            }
+            let mut bytes = e.into_bytes();
+            bytes.truncate(utf8_error.valid_up_to());
+            String::from_utf8(bytes).ok().map(|text| (text, total_len))
+        }
+    }
+}
+
 // ============================================================================
 // Docker Gatherer
 // ============================================================================
@@ -341,6 +388,22 @@ impl ContextGatherer for DirectoryGatherer {
     }
 }
 
+/// Maximum entries listed per directory in the context tree
+const MAX_TREE_ENTRIES: usize = 20;
+
+/// Directories shown in the context tree but not descended into
+const TREE_SKIP_DIRS: &[&str] = &[
+    "node_modules",
+    ".git",
+    "target",
+    "dist",
+    "build",
+    ".next",
+    "__pycache__",
+    ".venv",
+    "venv",
+];
+
 /// Build a directory tree string.
 fn build_directory_tree(path: &Path, max_depth: usize) -> String {
     let mut result = String::new();
@@ -359,40 +422,43 @@ fn build_tree_recursive(
         return;
     }
 
+    // Borrowed unless the name is not valid UTF-8
     let name = path
         .file_name()
-        .map(|n| n.to_string_lossy().to_string())
-        .unwrap_or_else(|| path.to_string_lossy().to_string());
+        .map(|n| n.to_string_lossy())
+        .unwrap_or_else(|| path.to_string_lossy());
 
     if path.is_dir() {
-        result.push_str(&format!("{}{}/\n", prefix, name));
+        result.push_str(prefix);
+        result.push_str(&name);
+        result.push_str("/\n");
 
         // Skip common non-essential directories
-        let skip_dirs = [
-            "node_modules",
-            ".git",
-            "target",
-            "dist",
-            "build",
-            ".next",
-            "__pycache__",
-            ".venv",
-            "venv",
-        ];
-
-        if skip_dirs.contains(&name.as_str()) {
+        if TREE_SKIP_DIRS.contains(&&*name) {
             return;
         }
 
         if let Ok(entries) = std::fs::read_dir(path) {
-            let mut entries: Vec<_> = entries.filter_map(|e| e.ok()).collect();
-            entries.sort_by_key(|e| e.file_name());
+            // Fetch each name once; sort_by_key(|e| e.file_name()) allocated
+            // two OsStrings per comparison.
+            let mut entries: Vec<(OsString, PathBuf)> = entries
+                .filter_map(|e| e.ok())
+                .map(|e| (e.file_name(), e.path()))
+                .collect();
+            let total = entries.len();
+
+            // Only the first MAX_TREE_ENTRIES names are shown, so partition
+            // them out and sort just those instead of the whole listing.
+            if total > MAX_TREE_ENTRIES {
+                entries.select_nth_unstable_by(MAX_TREE_ENTRIES - 1, |a, b| a.0.cmp(&b.0));
+                entries.truncate(MAX_TREE_ENTRIES);
+            }
+            entries.sort_unstable_by(|a, b| a.0.cmp(&b.0));
 
-            for entry in entries.iter().take(20) {
-                // Limit entries per directory
-                let child_prefix = format!("{}  ", prefix);
+            let child_prefix = format!("{}  ", prefix);
+            for (_, entry_path) in &entries {
                 build_tree_recursive(
-                    &entry.path(),
+                    entry_path,
                     &child_prefix,
                     max_depth,
                     current_depth + 1,
@@ -400,12 +466,18 @@ fn build_tree_recursive(
                 );
             }
 
-            if entries.len() > 20 {
-                result.push_str(&format!("{}  ... and {} more\n", prefix, entries.len() - 20));
+            if total > MAX_TREE_ENTRIES {
+                result.push_str(&format!(
+                    "{}  ... and {} more\n",
+                    prefix,
+                    total - MAX_TREE_ENTRIES
+                ));
             }
         }
     } else {
-        result.push_str(&format!("{}{}\n", prefix, name));
+        result.push_str(prefix);
+        result.push_str(&name);
+        result.push('\n');
     }
 }
 
@@ -673,6 +745,34 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_directory_tree_does_not_descend_into_skipped_dirs() {
+        let dir = tempdir().unwrap();
+        let modules = dir.path().join("node_modules").join("left-pad");
+        fs::create_dir_all(&modules).unwrap();
+        fs::write(modules.join("index.js"), "").unwrap();
+
+        let tree = build_directory_tree(dir.path(), 3);
+        assert!(tree.contains("  node_modules/\n"));
+        assert!(!tree.contains("left-pad"));
+    }
+
+    #[test]
+    fn test_directory_tree_lists_first_entries_by_name() {
+        let dir = tempdir().unwrap();
+        for i in (0..MAX_TREE_ENTRIES + 5).rev() {
+            fs::write(dir.path().join(format!("f{:02}.txt", i)), "").unwrap();
+        }
+
+        let tree = build_directory_tree(dir.path(), 1);
+        let listed: Vec<&str> = tree.lines().skip(1).take(MAX_TREE_ENTRIES).collect();
+
+        assert_eq!(listed.first(), Some(&"  f00.txt"));
+        assert_eq!(listed.last(), Some(&"  f19.txt"));
+        assert!(!tree.contains("f20.txt"));
+        assert!(tree.ends_with("  ... and 5 more\n"));
+    }
+
     #[test]
     fn test_file_gatherer() {
         let dir = tempdir().unwrap();
@@ -715,6 +815,47 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_file_gatherer_truncation_on_char_boundary() {
+        let dir = tempdir().unwrap();
+        let file_path = dir.path().join("unicode.txt");
+        // Each 'é' is two bytes, so a limit of 5 falls inside a character
+        fs::write(&file_path, "é".repeat(100)).unwrap();
+
+        let gatherer = FileGatherer {
+            file_paths: vec![file_path.to_string_lossy().to_string()],
+            max_file_size: 5,
+        };
+        let result = gatherer.gather(dir.path());
+
+        if let ContextContent::Files(files) = result.content {
+            assert!(files[0].content.starts_with("éé..."));
+            assert!(files[0].content.contains("196 more chars"));
+        } else {
+            panic!("Expected Files content");
+        }
+    }
+
+    #[test]
+    fn test_truncate_git_diff() {
+        assert_eq!(truncate_git_diff("small diff".to_string()), "small diff");
+
+        // Multi-byte chars straddling the limit must not panic
+        let truncated = truncate_git_diff("日".repeat(1000));
+        assert!(truncated.ends_with("...\n(truncated)"));
+        assert!(truncated.len() <= MAX_GIT_DIFF_LEN + "...\n(truncated)".len());
+    }
+
+    #[test]
+    fn test_floor_char_boundary() {
+        // "日" is 3 bytes, so byte 4 falls inside the second char
+        let s = "日日";
+        assert_eq!(floor_char_boundary(s, 4), 3);
+        assert_eq!(floor_char_boundary(s, 3), 3);
+        assert_eq!(floor_char_boundary(s, 0), 0);
+        assert_eq!(floor_char_boundary(s, 100), s.len());
+    }
+
     #[test]
     fn test_context_engine_priority() {
         let dir = tempdir().unwrap();
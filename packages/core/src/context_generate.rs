@@ -4,6 +4,7 @@
 
 use std::path::Path;
 
+use crate::context_engine::floor_char_boundary;
 use crate::context_sync::extract_json_from_response;
 
 /// Summary of codebase structure for AI analysis
@@ -43,7 +44,7 @@ impl GenerateContextResponse {
     /// Parse JSON string into GenerateContextResponse
     pub fn from_json(json_str: &str) -> Result<Self, String> {
         let json_str = extract_json_from_response(json_str);
-        serde_json::from_str(&json_str)
+        serde_json::from_str(json_str)
             .map_err(|e| format!("Failed to parse generate context response: {}", e))
     }
 }
@@ -75,6 +76,22 @@ pub fn read_codebase_summary(project_path: &Path) -> CodebaseSummary {
     }
 }
 
+/// Directories left out of the generated directory tree
+const SKIP_DIRS: &[&str] = &[
+    "node_modules",
+    "target",
+    ".git",
+    ".idea",
+    ".vscode",
+    "dist",
+    "build",
+    "__pycache__",
+    ".next",
+    "out",
+    ".turbo",
+    "coverage",
+];
+
 /// Build a tree-like representation of the directory structure
 fn build_directory_tree(path: &Path) -> String {
     let mut result = Vec::new();
@@ -93,32 +110,13 @@ fn build_tree_recursive(
         return;
     }
 
-    // Directories to skip
-    let skip_dirs = [
-        "node_modules",
-        "target",
-        ".git",
-        ".idea",
-        ".vscode",
-        "dist",
-        "build",
-        "__pycache__",
-        ".next",
-        "out",
-        ".turbo",
-        "coverage",
-    ];
-
     let entries: Vec<_> = match std::fs::read_dir(path) {
         Ok(entries) => entries
             .filter_map(|e| e.ok())
             .filter(|e| {
-                let name = e.file_name().to_string_lossy().to_string();
-                !name.starts_with('.') || name == ".rstn"
-            })
-            .filter(|e| {
-                let name = e.file_name().to_string_lossy().to_string();
-                !skip_dirs.contains(&name.as_str())
+                let file_name = e.file_name();
+                let name = file_name.to_string_lossy();
+                (!name.starts_with('.') || name == ".rstn") && !SKIP_DIRS.contains(&&*name)
             })
             .collect(),
         Err(_) => return,
@@ -252,12 +250,13 @@ Respond ONLY with the JSON object, no additional text."#,
     )
 }
 
-/// Truncate content to a maximum length
+/// Truncate content to a maximum length (in bytes, on a char boundary)
 fn truncate_content(content: &str, max_len: usize) -> String {
     if content.len() <= max_len {
         content.to_string()
     } else {
-        format!("{}...(truncated)", &content[..max_len])
+        let end = floor_char_boundary(content, max_len);
+        format!("{}...(truncated)", &content[..end])
     }
 }
 
@@ -310,6 +309,10 @@ mod tests {
         let truncated = truncate_content(&long, 50);
         assert!(truncated.ends_with("...(truncated)"));
         assert!(truncated.len() < 200);
+
+        // Must not split a multi-byte character
+        let unicode = "é".repeat(100);
+        assert_eq!(truncate_content(&unicode, 5), "éé...(truncated)");
     }
 
     #[test]
@@ -3,6 +3,7 @@
 //! Extracts valuable information from completed changes
 //! and updates Living Context files.
 
+use std::fmt::Write;
 use std::path::Path;
 
 /// Build the prompt for Claude to extract context updates from a completed change.
@@ -106,7 +107,7 @@ impl ContextSyncResponse {
         // Try to extract JSON from the response (it might have markdown code blocks)
         let json_str = extract_json_from_response(json_str);
 
-        serde_json::from_str(&json_str)
+        serde_json::from_str(json_str)
             .map_err(|e| format!("Failed to parse context sync response: {}", e))
     }
 
@@ -215,7 +216,7 @@ impl EnhancedContextSyncResponse {
     /// Parse JSON string into EnhancedContextSyncResponse
     pub fn from_json(json_str: &str) -> Result<Self, String> {
         let json_str = extract_json_from_response(json_str);
-        serde_json::from_str(&json_str)
+        serde_json::from_str(json_str)
             .map_err(|e| format!("Failed to parse enhanced context sync response: {}", e))
     }
 }
@@ -289,63 +290,68 @@ pub fn apply_context_updates(
 /// Append rows to a markdown table (adds after the last row)
 fn append_to_markdown_table(content: &str, new_rows: &str) -> String {
     let lines: Vec<&str> = content.lines().collect();
-    let mut result = Vec::new();
-    let mut found_table = false;
-    let mut last_table_row = 0;
 
     // Find the last table row (line starting with |)
-    for (i, line) in lines.iter().enumerate() {
-        if line.trim().starts_with('|') {
-            found_table = true;
-            last_table_row = i;
-        }
-    }
-
-    if found_table {
-        // Insert new rows after the last table row
-        for (i, line) in lines.iter().enumerate() {
-            result.push(line.to_string());
-            if i == last_table_row {
-                result.push(new_rows.to_string());
+    match lines.iter().rposition(|line| line.trim().starts_with('|')) {
+        Some(last_table_row) => {
+            // Insert new rows after the last table row, writing straight
+            // into one buffer instead of copying every line into a Vec
+            let mut result = String::with_capacity(content.len() + new_rows.len() + 1);
+            for (i, line) in lines.iter().enumerate() {
+                if i > 0 {
+                    result.push('\n');
+                }
+                result.push_str(line);
+                if i == last_table_row {
+                    result.push('\n');
+                    result.push_str(new_rows);
+                }
             }
+            result
         }
-        result.join("\n")
-    } else {
         // No table found, just append
-        format!("{}\n{}", content, new_rows)
+        None => format!("{}\n{}", content, new_rows),
     }
 }
 
 /// Prepend rows to a markdown table (adds after the header row)
 fn prepend_to_markdown_table(content: &str, new_row: &str) -> String {
-    let lines: Vec<&str> = content.lines().collect();
-    let mut result = Vec::new();
+    let mut result = String::with_capacity(content.len() + new_row.len() + 1);
+    let mut has_lines = false;
     let mut inserted = false;
 
-    for line in lines.iter() {
-        result.push(line.to_string());
+    for line in content.lines() {
+        if has_lines {
+            result.push('\n');
+        }
+        has_lines = true;
+        result.push_str(line);
 
         // Insert after the separator row (the line with |---|---|)
         if !inserted && line.contains("---") && line.starts_with('|') {
-            result.push(new_row.to_string());
+            result.push('\n');
+            result.push_str(new_row);
             inserted = true;
         }
     }
 
     if !inserted {
         // No separator found, just append
-        result.push(new_row.to_string());
+        if has_lines {
+            result.push('\n');
+        }
+        result.push_str(new_row);
     }
 
-    result.join("\n")
+    result
 }
 
 /// Extract JSON from a response that might have markdown code blocks
-pub fn extract_json_from_response(response: &str) -> String {
+pub fn extract_json_from_response(response: &str) -> &str {
     // Try to find JSON in code block
     if let Some(start) = response.find("```json") {
         if let Some(end) = response[start + 7..].find("```") {
-            return response[start + 7..start + 7 + end].trim().to_string();
+            return response[start + 7..start + 7 + end].trim();
         }
     }
 
@@ -354,7 +360,7 @@ pub fn extract_json_from_response(response: &str) -> String {
         let after_first = &response[start + 3..];
         if let Some(newline) = after_first.find('\n') {
             if let Some(end) = after_first[newline..].find("```") {
-                return after_first[newline..newline + end].trim().to_string();
+                return after_first[newline..newline + end].trim();
             }
         }
     }
@@ -363,62 +369,61 @@ pub fn extract_json_from_response(response: &str) -> String {
     if let Some(start) = response.find('{') {
         if let Some(end) = response.rfind('}') {
             if end > start {
-                return response[start..=end].to_string();
+                return &response[start..=end];
             }
         }
     }
 
     // Return as-is if no JSON found
-    response.to_string()
+    response
 }
 
 /// Generate markdown content to append to tech-stack.md
 pub fn format_tech_stack_additions(additions: &[TechStackAddition]) -> String {
-    if additions.is_empty() {
-        return String::new();
-    }
-
-    let mut lines = Vec::new();
-    for addition in additions {
-        lines.push(format!(
+    let mut out = String::new();
+    for (i, addition) in additions.iter().enumerate() {
+        if i > 0 {
+            out.push('\n');
+        }
+        let _ = write!(
+            out,
             "| {} | {} | {} |",
             addition.name, addition.version, addition.purpose
-        ));
+        );
     }
-    lines.join("\n")
+    out
 }
 
 /// Generate markdown content to append to system-architecture.md
 pub fn format_architecture_updates(updates: &[ArchitectureUpdate]) -> String {
-    if updates.is_empty() {
-        return String::new();
-    }
-
-    let mut lines = Vec::new();
-    for update in updates {
-        lines.push(format!(
+    let mut out = String::new();
+    for (i, update) in updates.iter().enumerate() {
+        if i > 0 {
+            out.push('\n');
+        }
+        let _ = write!(
+            out,
             "\n### {}\n\n{}\n\n*Location: {}*",
             update.component, update.description, update.location
-        ));
+        );
     }
-    lines.join("\n")
+    out
 }
 
 /// Generate markdown content to append to recent-changes.md
 pub fn format_recent_changes(summary: &str, decisions: &[KeyDecision]) -> String {
-    let mut lines = Vec::new();
-
-    let today = chrono::Utc::now().format("%Y-%m-%d").to_string();
-    lines.push(format!("| {} | {} | - |", today, summary));
+    let today = chrono::Utc::now().format("%Y-%m-%d");
+    let mut out = format!("| {} | {} | - |", today, summary);
 
     for decision in decisions {
-        lines.push(format!(
-            "\n**Decision ({})**: {}\n*Rationale: {}*",
+        let _ = write!(
+            out,
+            "\n\n**Decision ({})**: {}\n*Rationale: {}*",
             decision.date, decision.decision, decision.rationale
-        ));
+        );
     }
 
-    lines.join("\n")
+    out
 }
 
 #[cfg(test)]
@@ -450,6 +455,15 @@ mod tests {
         assert!(json.contains("recent_change_summary"));
     }
 
+    #[test]
+    fn test_extract_json_from_response_generic_code_block() {
+        let response = "Result:\n```\n{\"a\": 1}\n```\nDone";
+        assert_eq!(extract_json_from_response(response), "{\"a\": 1}");
+
+        let no_json = "no structured output";
+        assert_eq!(extract_json_from_response(no_json), no_json);
+    }
+
     #[test]
     fn test_parse_context_sync_response() {
         let json = r#"{
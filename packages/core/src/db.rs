@@ -4,10 +4,14 @@
 //! Database is stored at ~/.rstn/state.db with project_id column for data isolation.
 
 use rusqlite::{params, Connection, Result};
+use std::collections::HashMap;
 use std::sync::Mutex;
 use uuid::Uuid;
 
 /// Database manager - single global instance for all projects
+///
+/// Runtime queries use `prepare_cached`, so each SQL string is compiled once
+/// per connection instead of on every call.
 pub struct DbManager {
     conn: Mutex<Connection>,
 }
@@ -37,6 +41,16 @@ impl DbManager {
         Ok(manager)
     }
 
+    /// Open a migrated in-memory database for tests
+    #[cfg(test)]
+    fn open_in_memory() -> Result<Self> {
+        let manager = Self {
+            conn: Mutex::new(Connection::open_in_memory()?),
+        };
+        manager.run_migrations()?;
+        Ok(manager)
+    }
+
     /// Run initial migrations to set up tables
     fn run_migrations(&self) -> Result<()> {
         let conn = self.conn.lock().unwrap();
@@ -131,27 +145,27 @@ impl DbManager {
         let now = chrono::Utc::now().to_rfc3339();
         let conn = self.conn.lock().unwrap();
 
-        conn.execute(
+        conn.prepare_cached(
             "INSERT INTO file_comments (id, project_id, file_path, content, author, created_at, updated_at, line_number)
              VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8)",
-            params![
-                id,
-                project_id,
-                file_path,
-                content,
-                author,
-                now,
-                now,
-                line_number.map(|n| n as i64)
-            ],
-        )?;
+        )?
+        .execute(params![
+            id,
+            project_id,
+            file_path,
+            content,
+            author,
+            now,
+            now,
+            line_number.map(|n| n as i64)
+        ])?;
 
         Ok(id)
     }
 
     pub fn get_comments(&self, project_id: &str, file_path: &str) -> Result<Vec<CommentRow>> {
         let conn = self.conn.lock().unwrap();
-        let mut stmt = conn.prepare(
+        let mut stmt = conn.prepare_cached(
             "SELECT id, content, author, created_at, line_number FROM file_comments
              WHERE project_id = ?1 AND file_path = ?2 ORDER BY line_number ASC NULLS FIRST, created_at ASC",
         )?;
@@ -176,20 +190,43 @@ impl DbManager {
 
     pub fn delete_comment(&self, project_id: &str, id: &str) -> Result<()> {
         let conn = self.conn.lock().unwrap();
-        conn.execute(
-            "DELETE FROM file_comments WHERE project_id = ?1 AND id = ?2",
-            params![project_id, id],
-        )?;
+        conn.prepare_cached("DELETE FROM file_comments WHERE project_id = ?1 AND id = ?2")?
+            .execute(params![project_id, id])?;
         Ok(())
     }
 
-    pub fn get_comment_count(&self, project_id: &str, file_path: &str) -> Result<usize> {
+    /// Get comment counts for the files directly inside `dir_prefix`, keyed
+    /// by file_path.
+    ///
+    /// Directory listings pass the listed directory (relative to the project
+    /// root, with a trailing separator; empty for the root) to fetch every
+    /// count in one query. The range on file_path is served by the
+    /// `(project_id, file_path)` index, and paths with a further separator
+    /// (deeper descendants) are left out.
+    pub fn get_comment_counts(
+        &self,
+        project_id: &str,
+        dir_prefix: &str,
+    ) -> Result<HashMap<String, usize>> {
         let conn = self.conn.lock().unwrap();
-        let mut stmt = conn.prepare(
-            "SELECT COUNT(*) FROM file_comments WHERE project_id = ?1 AND file_path = ?2",
+        let mut stmt = conn.prepare_cached(
+            "SELECT file_path, COUNT(*) FROM file_comments
+             WHERE project_id = ?1 AND file_path >= ?2 AND file_path < ?2 || char(1114111)
+               AND instr(substr(file_path, length(?2) + 1), ?3) = 0
+             GROUP BY file_path",
         )?;
-        let count: usize = stmt.query_row(params![project_id, file_path], |row| row.get(0))?;
-        Ok(count)
+
+        let separator = std::path::MAIN_SEPARATOR.to_string();
+        let rows = stmt.query_map(params![project_id, dir_prefix, separator], |row| {
+            Ok((row.get::<_, String>(0)?, row.get::<_, usize>(1)?))
+        })?;
+
+        let mut counts = HashMap::new();
+        for row in rows {
+            let (file_path, count) = row?;
+            counts.insert(file_path, count);
+        }
+        Ok(counts)
     }
 
     // ========================================================================
@@ -207,18 +244,18 @@ impl DbManager {
         let now = chrono::Utc::now().to_rfc3339();
         let conn = self.conn.lock().unwrap();
 
-        conn.execute(
+        conn.prepare_cached(
             "INSERT INTO activity_logs (project_id, category, level, summary, detail_json, timestamp)
              VALUES (?1, ?2, ?3, ?4, ?5, ?6)",
-            params![project_id, category, level, summary, detail_json, now],
-        )?;
+        )?
+        .execute(params![project_id, category, level, summary, detail_json, now])?;
 
         Ok(conn.last_insert_rowid())
     }
 
     pub fn get_logs(&self, project_id: &str, limit: usize) -> Result<Vec<LogRow>> {
         let conn = self.conn.lock().unwrap();
-        let mut stmt = conn.prepare(
+        let mut stmt = conn.prepare_cached(
             "SELECT id, category, level, summary, detail_json, timestamp
              FROM activity_logs WHERE project_id = ?1 ORDER BY timestamp DESC LIMIT ?2",
         )?;
@@ -263,3 +300,50 @@ pub struct LogRow {
 }
 
 // Activity Log integration will be added in Phase B1.3
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_get_comment_counts_groups_by_file() {
+        let db = DbManager::open_in_memory().unwrap();
+        db.add_comment("p1", "main.rs", "a", "user", None).unwrap();
+        db.add_comment("p1", "main.rs", "b", "user", Some(3))
+            .unwrap();
+        db.add_comment("p1", "README.md", "c", "user", None)
+            .unwrap();
+        db.add_comment("p2", "main.rs", "other project", "user", None)
+            .unwrap();
+
+        let counts = db.get_comment_counts("p1", "").unwrap();
+        assert_eq!(counts.len(), 2);
+        assert_eq!(counts["main.rs"], 2);
+        assert_eq!(counts["README.md"], 1);
+    }
+
+    #[test]
+    fn test_get_comment_counts_only_direct_children() {
+        let sep = std::path::MAIN_SEPARATOR;
+        let main_rs = format!("src{sep}main.rs");
+        let nested = format!("src{sep}explorer{sep}mod.rs");
+
+        let db = DbManager::open_in_memory().unwrap();
+        db.add_comment("p1", &main_rs, "a", "user", None).unwrap();
+        db.add_comment("p1", &nested, "b", "user", None).unwrap();
+        db.add_comment("p1", "srcfile.rs", "c", "user", None)
+            .unwrap();
+        db.add_comment("p1", "README.md", "d", "user", None)
+            .unwrap();
+
+        let counts = db.get_comment_counts("p1", &format!("src{sep}")).unwrap();
+        assert_eq!(counts.len(), 1);
+        assert_eq!(counts[&main_rs], 1);
+
+        // The root listing does not pull in comments from subdirectories
+        let counts = db.get_comment_counts("p1", "").unwrap();
+        assert_eq!(counts.len(), 2);
+        assert!(counts.contains_key("srcfile.rs"));
+        assert!(counts.contains_key("README.md"));
+    }
+}
@@ -10,7 +10,7 @@ use bollard::image::CreateImageOptions;
 use bollard::models::HostConfig;
 use bollard::Docker;
 use futures_util::StreamExt;
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use tracing::{debug, info};
 
 /// Built-in service definitions
@@ -114,7 +114,7 @@ impl DockerManager {
             .unwrap_or_default();
 
         // Track which rstn services are already running
-        let mut running_rstn_ids: Vec<String> = Vec::new();
+        let mut running_rstn_ids: HashSet<String> = HashSet::new();
 
         // Build service list from ALL running containers
         for container in &all_containers {
@@ -134,7 +134,7 @@ impl DockerManager {
 
             // Track running rstn services
             if is_rstn_managed {
-                running_rstn_ids.push(container_name.clone());
+                running_rstn_ids.insert(container_name.clone());
             }
 
             let status = match container.state.as_deref() {
@@ -166,7 +166,7 @@ impl DockerManager {
 
         // Add built-in rstn services that aren't running (for Quick Start)
         for config in BUILTIN_SERVICES {
-            if !running_rstn_ids.contains(&config.id.to_string()) {
+            if !running_rstn_ids.contains(config.id) {
                 services.push(DockerService {
                     id: config.id.to_string(),
                     name: config.name.to_string(),
@@ -686,12 +686,12 @@ impl DockerManager {
             .unwrap_or_default();
 
         // Collect all used ports
-        let mut used_ports: Vec<u16> = Vec::new();
+        let mut used_ports: HashSet<u16> = HashSet::new();
         for container in &containers {
             if let Some(ports) = &container.ports {
                 for port_info in ports {
                     if let Some(public_port) = port_info.public_port {
-                        used_ports.push(public_port);
+                        used_ports.insert(public_port);
                     }
                 }
             }
@@ -2,6 +2,7 @@
 //!
 //! Handles copying dotfiles between worktrees for environment synchronization.
 
+use crate::fs_util::entry_is_dir;
 use std::fs;
 use std::path::Path;
 
@@ -121,11 +122,9 @@ fn copy_path(src: &Path, dst: &Path) -> Result<(), String> {
     if src.is_dir() {
         copy_dir_recursive(src, dst)
     } else {
-        // Ensure parent directory exists
+        // Ensure parent directory exists (create_dir_all is a no-op if it does)
         if let Some(parent) = dst.parent() {
-            if !parent.exists() {
-                fs::create_dir_all(parent).map_err(|e| e.to_string())?;
-            }
+            fs::create_dir_all(parent).map_err(|e| e.to_string())?;
         }
         fs::copy(src, dst)
             .map(|_| ())
@@ -135,16 +134,14 @@ fn copy_path(src: &Path, dst: &Path) -> Result<(), String> {
 
 /// Recursively copy a directory
 fn copy_dir_recursive(src: &Path, dst: &Path) -> Result<(), String> {
-    if !dst.exists() {
-        fs::create_dir_all(dst).map_err(|e| format!("Failed to create directory: {}", e))?;
-    }
+    fs::create_dir_all(dst).map_err(|e| format!("Failed to create directory: {}", e))?;
 
     for entry in fs::read_dir(src).map_err(|e| format!("Failed to read directory: {}", e))? {
         let entry = entry.map_err(|e| format!("Failed to read entry: {}", e))?;
         let src_path = entry.path();
         let dst_path = dst.join(entry.file_name());
 
-        if src_path.is_dir() {
+        if entry_is_dir(&entry) {
             copy_dir_recursive(&src_path, &dst_path)?;
         } else {
             fs::copy(&src_path, &dst_path)
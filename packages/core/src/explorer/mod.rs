@@ -7,8 +7,19 @@ use crate::db::DbManager;
 use ignore::WalkBuilder;
 use std::collections::HashMap;
 use std::fs;
-use std::path::Path;
+use std::path::{Path, PathBuf};
 use std::process::Command;
+use std::sync::{Arc, Mutex, OnceLock};
+use std::time::{Duration, Instant};
+
+/// How long a `git status` snapshot is reused across directory reads
+const GIT_STATUS_TTL: Duration = Duration::from_secs(2);
+
+type GitStatusMap = HashMap<String, GitFileStatus>;
+
+/// Recent `git status` snapshots keyed by project root
+static GIT_STATUS_CACHE: OnceLock<Mutex<HashMap<PathBuf, (Instant, Arc<GitStatusMap>)>>> =
+    OnceLock::new();
 
 /// Read a directory and return a list of file entries with Git status.
 /// Respects .gitignore rules.
@@ -21,7 +32,21 @@ pub fn read_directory(
     let mut entries = Vec::new();
     
     // 1. Get Git status for the project to overlay on files
-    let git_status_map = get_git_status(project_root).unwrap_or_default();
+    let git_status_map = get_git_status_cached(project_root).unwrap_or_default();
+
+    // Fetch comment counts for this directory's entries in one query
+    // (requires project_id for isolation)
+    let mut dir_prefix = path
+        .strip_prefix(project_root)
+        .unwrap_or(path)
+        .to_string_lossy()
+        .to_string();
+    if !dir_prefix.is_empty() {
+        dir_prefix.push(std::path::MAIN_SEPARATOR);
+    }
+    let comment_counts = db
+        .and_then(|db_mgr| db_mgr.get_comment_counts(project_id, &dir_prefix).ok())
+        .unwrap_or_default();
 
     // 2. Read directory entries using 'ignore' crate
     // We only want immediate children, so we set max_depth to 1.
@@ -76,12 +101,7 @@ pub fn read_directory(
 
         let git_status = git_status_map.get(&rel_path).cloned();
         
-        // Fetch comment count from SQLite (requires project_id for isolation)
-        let comment_count = if let Some(db_mgr) = db {
-            db_mgr.get_comment_count(project_id, &rel_path).unwrap_or(0)
-        } else {
-            0
-        };
+        let comment_count = comment_counts.get(&rel_path).copied().unwrap_or(0);
 
         entries.push(FileEntry {
             name,
@@ -98,8 +118,62 @@ pub fn read_directory(
     Ok(entries)
 }
 
+/// Get the git status map for a project, reusing a snapshot younger than
+/// `GIT_STATUS_TTL`.
+///
+/// Expanding several folders in quick succession would otherwise run a
+/// full-repository `git status --ignored` per directory. The TTL is the only
+/// invalidation: the git commands this crate runs (`worktree add`/`remove`)
+/// do not change the status of a listed root, while edits made from a
+/// terminal or by the Claude CLI are not observable here. Such a change can
+/// take up to the TTL to show up in a listing.
+///
+/// The lock is not held while git runs, so a slow repository does not stall
+/// listings of other projects.
+fn get_git_status_cached(project_root: &Path) -> Option<Arc<GitStatusMap>> {
+    let cache = GIT_STATUS_CACHE.get_or_init(|| Mutex::new(HashMap::new()));
+
+    let now = Instant::now();
+    if let Some(status_map) = fresh_git_status(&cache.lock().unwrap(), project_root, now) {
+        return Some(status_map);
+    }
+
+    let status_map = Arc::new(get_git_status(project_root)?);
+    store_git_status(
+        &mut cache.lock().unwrap(),
+        project_root,
+        Instant::now(),
+        Arc::clone(&status_map),
+    );
+    Some(status_map)
+}
+
+/// Return the cached snapshot for `project_root` if it is still fresh at `now`.
+fn fresh_git_status(
+    cache: &HashMap<PathBuf, (Instant, Arc<GitStatusMap>)>,
+    project_root: &Path,
+    now: Instant,
+) -> Option<Arc<GitStatusMap>> {
+    cache
+        .get(project_root)
+        .filter(|(taken_at, _)| now.duration_since(*taken_at) < GIT_STATUS_TTL)
+        .map(|(_, status_map)| Arc::clone(status_map))
+}
+
+/// Store a snapshot taken at `now`, evicting every expired one so the cache
+/// only holds roots read within the last `GIT_STATUS_TTL`.
+fn store_git_status(
+    cache: &mut HashMap<PathBuf, (Instant, Arc<GitStatusMap>)>,
+    project_root: &Path,
+    now: Instant,
+    status_map: Arc<GitStatusMap>,
+) {
+    cache.retain(|_, (taken_at, _)| now.duration_since(*taken_at) < GIT_STATUS_TTL);
+    cache.insert(project_root.to_path_buf(), (now, status_map));
+}
+
 /// Run `git status --porcelain` and parse results into a map of Path -> Status
-fn get_git_status(project_root: &Path) -> Option<HashMap<String, GitFileStatus>> {
+fn get_git_status(project_root: &Path) -> Option<GitStatusMap> {
     let output = Command::new("git")
         .arg("status")
         .arg("--porcelain")
@@ -166,3 +240,56 @@ fn get_permissions_string(metadata: &fs::Metadata) -> String {
         if metadata.permissions().readonly() { "r--r--r--".to_string() } else { "rw-rw-rw-".to_string() }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn status_map(path: &str) -> Arc<GitStatusMap> {
+        let mut map = HashMap::new();
+        map.insert(path.to_string(), GitFileStatus::Modified);
+        Arc::new(map)
+    }
+
+    #[test]
+    fn test_fresh_git_status_within_ttl() {
+        let mut cache = HashMap::new();
+        let root = Path::new("/repo");
+        let start = Instant::now();
+
+        let stored = status_map("a.rs");
+        store_git_status(&mut cache, root, start, Arc::clone(&stored));
+
+        let fresh = fresh_git_status(&cache, root, start + GIT_STATUS_TTL / 2).unwrap();
+        assert!(Arc::ptr_eq(&stored, &fresh));
+    }
+
+    #[test]
+    fn test_fresh_git_status_expires_after_ttl() {
+        let mut cache = HashMap::new();
+        let root = Path::new("/repo");
+        let start = Instant::now();
+
+        store_git_status(&mut cache, root, start, status_map("a.rs"));
+
+        assert!(fresh_git_status(&cache, root, start + GIT_STATUS_TTL).is_none());
+        assert!(fresh_git_status(&cache, Path::new("/other"), start).is_none());
+    }
+
+    #[test]
+    fn test_store_git_status_evicts_expired_roots() {
+        let mut cache = HashMap::new();
+        let start = Instant::now();
+
+        store_git_status(&mut cache, Path::new("/old"), start, status_map("a.rs"));
+        store_git_status(
+            &mut cache,
+            Path::new("/new"),
+            start + GIT_STATUS_TTL,
+            status_map("b.rs"),
+        );
+
+        assert_eq!(cache.len(), 1);
+        assert!(cache.contains_key(Path::new("/new")));
+    }
+}
@@ -5,6 +5,8 @@
 //! - ~/.rstn/ directory (and subdirectories)
 
 use crate::persistence::get_rstn_dir;
+use std::fs::File;
+use std::io::Read;
 use std::path::{Path, PathBuf};
 use thiserror::Error;
 
@@ -64,25 +66,9 @@ pub fn read_file(path: &str, project_root: &str) -> Result<String, FileReadError
         return Err(FileReadError::SecurityViolation(path.to_string()));
     }
 
-    // Check file size
-    let metadata =
-        std::fs::metadata(&canonical_path).map_err(|e| FileReadError::Io(e.to_string()))?;
-
-    if metadata.len() > MAX_FILE_SIZE {
-        return Err(FileReadError::FileTooLarge {
-            size: metadata.len(),
-            limit: MAX_FILE_SIZE,
-        });
-    }
-
-    // Read file
-    std::fs::read_to_string(&canonical_path).map_err(|e| {
-        if e.kind() == std::io::ErrorKind::InvalidData {
-            FileReadError::NotUtf8
-        } else {
-            FileReadError::Io(e.to_string())
-        }
-    })
+    // Read file (size-checked)
+    let bytes = read_limited(&canonical_path)?;
+    String::from_utf8(bytes).map_err(|_| FileReadError::NotUtf8)
 }
 
 /// Read a binary file with security validation.
@@ -116,19 +102,33 @@ pub fn read_binary_file(path: &str, project_root: &str) -> Result<Vec<u8>, FileR
         return Err(FileReadError::SecurityViolation(path.to_string()));
     }
 
-    // Check file size
-    let metadata =
-        std::fs::metadata(&canonical_path).map_err(|e| FileReadError::Io(e.to_string()))?;
+    // Read file as binary (size-checked)
+    read_limited(&canonical_path)
+}
 
-    if metadata.len() > MAX_FILE_SIZE {
+/// Read a file of at most `MAX_FILE_SIZE` bytes.
+///
+/// The size comes from the open handle, so the file is opened and stat'ed
+/// once, and the read is capped in case the file grows after the check.
+fn read_limited(canonical_path: &Path) -> Result<Vec<u8>, FileReadError> {
+    let file = File::open(canonical_path).map_err(|e| FileReadError::Io(e.to_string()))?;
+    let size = file
+        .metadata()
+        .map_err(|e| FileReadError::Io(e.to_string()))?
+        .len();
+
+    if size > MAX_FILE_SIZE {
         return Err(FileReadError::FileTooLarge {
-            size: metadata.len(),
+            size,
             limit: MAX_FILE_SIZE,
         });
     }
 
-    // Read file as binary
-    std::fs::read(&canonical_path).map_err(|e| FileReadError::Io(e.to_string()))
+    let mut bytes = Vec::with_capacity(size as usize);
+    file.take(MAX_FILE_SIZE)
+        .read_to_end(&mut bytes)
+        .map_err(|e| FileReadError::Io(e.to_string()))?;
+    Ok(bytes)
 }
 
 /// Build list of allowed root directories
@@ -136,22 +136,17 @@ fn build_allowed_roots(project_root: &str) -> Result<Vec<PathBuf>, FileReadError
     let mut roots = Vec::new();
 
     // Add project root (canonicalized)
-    let project_path = Path::new(project_root);
-    if project_path.exists() {
-        if let Ok(canonical) = project_path.canonicalize() {
-            roots.push(canonical);
-        }
+    // (canonicalize() fails on a missing path, so no separate exists() check)
+    if let Ok(canonical) = Path::new(project_root).canonicalize() {
+        roots.push(canonical);
     }
 
     // Add ~/.rstn/
     let rstn_dir = get_rstn_dir();
-    if rstn_dir.exists() {
-        if let Ok(canonical) = rstn_dir.canonicalize() {
-            roots.push(canonical);
-        }
-    } else {
+    match rstn_dir.canonicalize() {
+        Ok(canonical) => roots.push(canonical),
         // ~/.rstn/ might not exist yet, add it anyway for future creation
-        roots.push(rstn_dir);
+        Err(_) => roots.push(rstn_dir),
     }
 
     Ok(roots)
@@ -226,6 +221,27 @@ mod tests {
         assert_eq!(result.unwrap(), "nested content");
     }
 
+    #[test]
+    fn test_read_file_not_utf8() {
+        let temp_dir = TempDir::new().unwrap();
+        let file_path = temp_dir.path().join("image.bin");
+        fs::write(&file_path, [0xff, 0xfe, 0x00, 0x80]).unwrap();
+
+        let result = read_file(
+            file_path.to_str().unwrap(),
+            temp_dir.path().to_str().unwrap(),
+        );
+        assert!(matches!(result, Err(FileReadError::NotUtf8)));
+
+        // The same bytes come back untouched through the binary reader
+        let bytes = read_binary_file(
+            file_path.to_str().unwrap(),
+            temp_dir.path().to_str().unwrap(),
+        )
+        .unwrap();
+        assert_eq!(bytes, vec![0xff, 0xfe, 0x00, 0x80]);
+    }
+
     #[test]
     fn test_read_file_traversal_attack() {
         let temp_dir = TempDir::new().unwrap();
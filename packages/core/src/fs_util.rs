@@ -0,0 +1,13 @@
+//! Small filesystem helpers shared across modules.
+
+use std::fs::DirEntry;
+
+/// Check whether a directory entry is a directory, following symlinks.
+///
+/// The file type comes with the directory read itself; only symlinks need a
+/// stat to find out whether they point at a directory.
+pub(crate) fn entry_is_dir(entry: &DirEntry) -> bool {
+    entry.file_type().map_or(false, |ft| {
+        ft.is_dir() || (ft.is_symlink() && entry.path().is_dir())
+    })
+}
@@ -39,8 +39,14 @@ pub fn parse_justfile(path: &str) -> Result<Vec<JustCommand>, String> {
             continue;
         }
 
-        // Check for command definition (name followed by colon)
-        if !line.starts_with(' ') && !line.starts_with('\t') && line.contains(':') {
+        // Check for command definition (name followed by colon); split_once
+        // finds the colon and yields the name in one scan
+        let definition = if line.starts_with(' ') || line.starts_with('\t') {
+            None
+        } else {
+            line.split_once(':')
+        };
+        if let Some((head, _)) = definition {
             // Save previous command if exists
             if let Some(name) = current_name.take() {
                 commands.push(JustCommand {
@@ -48,20 +54,17 @@ pub fn parse_justfile(path: &str) -> Result<Vec<JustCommand>, String> {
                     description: current_description.take(),
                     recipe: current_recipe.trim().to_string(),
                 });
-                current_recipe = String::new();
+                current_recipe.clear();
             }
 
             // Parse new command name
-            let parts: Vec<&str> = line.splitn(2, ':').collect();
-            if !parts.is_empty() {
-                let name = parts[0].trim();
-                // Skip if it looks like a variable assignment
-                if !name.contains('=') && !name.is_empty() {
-                    current_name = Some(name.to_string());
-                    // The pending description belongs to THIS command
-                    current_description = pending_description.take();
-                    in_recipe = true;
-                }
+            let name = head.trim();
+            // Skip if it looks like a variable assignment
+            if !name.contains('=') && !name.is_empty() {
+                current_name = Some(name.to_string());
+                // The pending description belongs to THIS command
+                current_description = pending_description.take();
+                in_recipe = true;
             }
             continue;
         }
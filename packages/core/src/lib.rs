@@ -20,6 +20,7 @@ pub mod context_sync;
 pub mod docker;
 pub mod env;
 pub mod file_reader;
+mod fs_util;
 pub mod justfile;
 pub mod mcp_config;
 pub mod mcp_server;
@@ -30,6 +31,9 @@ pub mod state;
 pub mod terminal;
 pub mod worktree;
 
+#[cfg(test)]
+mod tests;
+
 use actions::Action;
 use app_state::AppState;
 use docker::DockerManager;
@@ -670,12 +674,15 @@ pub async fn state_dispatch(action_json: String) -> napi::Result<()> {
     // Handle async operations based on action type
     handle_async_action(action).await?;
 
-    // Auto-save state (non-blocking)
+    // Auto-save state (non-blocking). Only the global fields are persisted
+    // here, so snapshot those rather than cloning the whole AppState.
     {
-        let state = get_app_state().read().await;
-        let state_clone = state.clone();
+        let persisted = {
+            let state = get_app_state().read().await;
+            persistence::GlobalPersistedState::from_app_state(&state)
+        };
         tokio::spawn(async move {
-            if let Err(e) = persistence::save_global(&state_clone) {
+            if let Err(e) = persistence::save_global(&persisted) {
                 tracing::warn!("Failed to save global state: {}", e);
             }
         });
@@ -1880,15 +1887,10 @@ async fn handle_async_action(action: Action) -> napi::Result<()> {
                         }
                     }
 
-                    // Ensure typing flag is cleared after loop exits
-                    {
-                        let mut state = get_app_state().write().await;
-                        reduce(&mut state, Action::SetChatTyping { is_typing: false });
-                    }
-                    notify_state_update().await;
+                    // Every exit from the loop above has already cleared the
+                    // typing flag and notified the renderer
 
-                    // Wait for process to finish
-                    let _ = child.wait().await;
+                    claude_cli::reap_claude(&mut child).await;
                 }
                 Err(e) => {
                     let error = e.to_string();
@@ -2110,15 +2112,37 @@ Be specific, actionable, and authoritative. Use "MUST", "MUST NOT" language."#,
                     .arg(&prompt)
                     .current_dir(&cwd_for_task)
                     .stdout(std::process::Stdio::piped())
-                    .stderr(std::process::Stdio::piped());
+                    .stderr(std::process::Stdio::piped())
+                    .kill_on_drop(true);
 
                 match cmd.spawn() {
                     Ok(mut child) => {
                         let stdout = child.stdout.take().expect("Failed to get stdout");
                         let mut reader = tokio::io::BufReader::new(stdout).lines();
 
-                        // Stream output
-                        while let Ok(Some(line)) = reader.next_line().await {
+                        // Stream output; a hung or broken stream must not be saved
+                        // as a finished constitution
+                        let mut stream_error = None;
+                        loop {
+                            let line = match tokio::time::timeout(
+                                claude_cli::EVENT_TIMEOUT,
+                                reader.next_line(),
+                            )
+                            .await
+                            {
+                                Ok(Ok(Some(line))) => line,
+                                Ok(Ok(None)) => break,
+                                Ok(Err(e)) => {
+                                    stream_error =
+                                        Some(format!("Failed to read Claude CLI output: {}", e));
+                                    break;
+                                }
+                                Err(_) => {
+                                    stream_error =
+                                        Some("Claude CLI timed out waiting for output".to_string());
+                                    break;
+                                }
+                            };
                             if let Ok(event) = serde_json::from_str::<serde_json::Value>(&line) {
                                 // Extract content from Claude streaming events
                                 if let Some(content_block) = event["content_block"].as_object() {
@@ -2149,8 +2173,16 @@ Be specific, actionable, and authoritative. Use "MUST", "MUST NOT" language."#,
                             }
                         }
 
-                        // Wait for process to complete
-                        let _ = child.wait().await;
+                        claude_cli::reap_claude(&mut child).await;
+
+                        if let Some(error_msg) = stream_error {
+                            eprintln!("{}", error_msg);
+                            let mut state = get_app_state().write().await;
+                            reduce(&mut state, Action::SetConstitutionError { error: error_msg });
+                            drop(state);
+                            notify_state_update().await;
+                            return;
+                        }
 
                         // After completion, save the constitution file
                         let (output, worktree_path) = {
@@ -2774,6 +2806,10 @@ Output ONLY the markdown content, no code blocks or extra formatting."#,
                             eprintln!("Failed to create Claude event stream: {}", e);
                         }
                     }
+
+                    tokio::spawn(async move {
+                        claude_cli::reap_claude(&mut child).await;
+                    });
                 }
                 Err(e) => {
                     eprintln!("Failed to spawn Claude CLI: {}", e);
@@ -2951,6 +2987,10 @@ Output ONLY the markdown content, no code blocks or extra formatting."#,
                             eprintln!("Failed to create Claude event stream: {}", e);
                         }
                     }
+
+                    tokio::spawn(async move {
+                        claude_cli::reap_claude(&mut child).await;
+                    });
                 }
                 Err(e) => {
                     eprintln!("Failed to spawn Claude CLI: {}", e);
@@ -3079,11 +3119,12 @@ Execute the plan now. Start implementing."#,
                     // Create event stream
                     match claude_cli::ClaudeEventStream::new(&mut child) {
                         Ok(mut stream) => {
+                            // Tool calls (builds, test runs) can go quiet for far
+                            // longer than EVENT_TIMEOUT, so an implementation is only
+                            // cut off at the overall TOTAL_TIMEOUT deadline.
+                            let deadline = tokio::time::Instant::now() + claude_cli::TOTAL_TIMEOUT;
                             loop {
-                                match tokio::time::timeout(
-                                    claude_cli::EVENT_TIMEOUT,
-                                    stream.next_event()
-                                ).await {
+                                match tokio::time::timeout_at(deadline, stream.next_event()).await {
                                     Ok(Some(Ok(event))) => {
                                         // Extract text from streaming events
                                         if let Some(text_chunk) = claude_cli::extract_text_delta(&event) {
@@ -3136,7 +3177,17 @@ Execute the plan now. Start implementing."#,
                                         break;
                                     }
                                     Err(_) => {
+                                        // The CLI is killed when reaped below, so the
+                                        // change must not stay in "implementing"
                                         eprintln!("ExecutePlan: Timeout waiting for event");
+                                        {
+                                            let mut state = get_app_state().write().await;
+                                            reduce(&mut state, Action::FailImplementation {
+                                                change_id: change_id_clone.clone(),
+                                                error: "Implementation exceeded 5 minute timeout".to_string(),
+                                            });
+                                        }
+                                        notify_state_update().await;
                                         break;
                                     }
                                 }
@@ -3155,8 +3206,9 @@ Execute the plan now. Start implementing."#,
                         }
                     }
 
-                    // Wait for process to finish
-                    let _ = child.wait().await;
+                    tokio::spawn(async move {
+                        claude_cli::reap_claude(&mut child).await;
+                    });
                 }
                 Err(e) => {
                     eprintln!("ExecutePlan: Failed to spawn Claude CLI: {}", e);
@@ -3188,45 +3240,44 @@ Execute the plan now. Start implementing."#,
                     .join("changes");
 
                 let mut changes = Vec::new();
+                let now = chrono::Utc::now().to_rfc3339();
 
-                if changes_dir.exists() {
-                    if let Ok(entries) = std::fs::read_dir(&changes_dir) {
-                        for entry in entries.flatten() {
-                            if entry.path().is_dir() {
-                                let change_name = entry.file_name().to_string_lossy().to_string();
-                                let intent_path = entry.path().join("intent.md");
-                                let proposal_path = entry.path().join("proposal.md");
-                                let plan_path = entry.path().join("plan.md");
-
-                                let intent = std::fs::read_to_string(&intent_path)
-                                    .unwrap_or_default();
-                                let proposal = std::fs::read_to_string(&proposal_path).ok();
-                                let plan = std::fs::read_to_string(&plan_path).ok();
-
-                                // Determine status from files
-                                let status = if plan.is_some() {
-                                    app_state::ChangeStatus::Planned
-                                } else {
-                                    // Default to Proposed if no plan yet
-                                    app_state::ChangeStatus::Proposed
-                                };
-
-                                let now = chrono::Utc::now().to_rfc3339();
-                                changes.push(app_state::Change {
-                                    id: format!("change-{}", change_name),
-                                    name: change_name,
-                                    status,
-                                    intent,
-                                    proposal,
-                                    plan,
-                                    streaming_output: String::new(),
-                                    created_at: now.clone(),
-                                    updated_at: now,
-                                    proposal_review_session_id: None,
-                                    plan_review_session_id: None,
-                                    context_files: Vec::new(),
-                                });
-                            }
+                if let Ok(entries) = std::fs::read_dir(&changes_dir) {
+                    for entry in entries.flatten() {
+                        if fs_util::entry_is_dir(&entry) {
+                            let change_dir = entry.path();
+                            let change_name = entry.file_name().to_string_lossy().to_string();
+                            let intent_path = change_dir.join("intent.md");
+                            let proposal_path = change_dir.join("proposal.md");
+                            let plan_path = change_dir.join("plan.md");
+
+                            let intent = std::fs::read_to_string(&intent_path)
+                                .unwrap_or_default();
+                            let proposal = std::fs::read_to_string(&proposal_path).ok();
+                            let plan = std::fs::read_to_string(&plan_path).ok();
+
+                            // Determine status from files
+                            let status = if plan.is_some() {
+                                app_state::ChangeStatus::Planned
+                            } else {
+                                // Default to Proposed if no plan yet
+                                app_state::ChangeStatus::Proposed
+                            };
+
+                            changes.push(app_state::Change {
+                                id: format!("change-{}", change_name),
+                                name: change_name,
+                                status,
+                                intent,
+                                proposal,
+                                plan,
+                                streaming_output: String::new(),
+                                created_at: now.clone(),
+                                updated_at: now.clone(),
+                                proposal_review_session_id: None,
+                                plan_review_session_id: None,
+                                context_files: Vec::new(),
+                            });
                         }
                     }
                 }
@@ -3534,6 +3585,10 @@ Execute the plan now. Start implementing."#,
                                 notify_state_update().await;
                             }
                         }
+
+                        tokio::spawn(async move {
+                            claude_cli::reap_claude(&mut child).await;
+                        });
                     }
                     Err(e) => {
                         eprintln!("[GenerateContext] Failed to spawn Claude: {}", e);
@@ -3806,6 +3861,10 @@ Execute the plan now. Start implementing."#,
                                 notify_state_update().await;
                             }
                         }
+
+                        tokio::spawn(async move {
+                            claude_cli::reap_claude(&mut child).await;
+                        });
                     }
                     Err(e) => {
                         eprintln!("[SyncContext] Failed to spawn Claude: {}", e);
@@ -4062,18 +4121,40 @@ Execute the plan now. Start implementing."#,
     Ok(())
 }
 
+/// Maximum length (in chars) of a change slug
+const MAX_SLUG_LEN: usize = 50;
+
 /// Convert intent to a URL-friendly slug
+///
+/// Runs of non-alphanumeric characters collapse into a single `-`, leading
+/// and trailing separators are dropped, and the result is capped at
+/// `MAX_SLUG_LEN` chars. Built in a single pass over the lowercased intent.
 fn slugify(intent: &str) -> String {
-    intent
-        .to_lowercase()
-        .chars()
-        .map(|c| if c.is_alphanumeric() { c } else { '-' })
-        .collect::<String>()
-        .split('-')
-        .filter(|s| !s.is_empty())
-        .collect::<Vec<_>>()
-        .join("-")
-        .chars()
-        .take(50)
-        .collect()
+    let mut slug = String::with_capacity(intent.len().min(MAX_SLUG_LEN));
+    let mut len = 0;
+    let mut pending_dash = false;
+
+    // Lowercase per char so a long intent stops being scanned at the cap
+    for c in intent.chars().flat_map(char::to_lowercase) {
+        if !c.is_alphanumeric() {
+            pending_dash = true;
+            continue;
+        }
+        if pending_dash && len > 0 {
+            // A dash in the last slot would be a trailing separator
+            if len + 1 == MAX_SLUG_LEN {
+                break;
+            }
+            slug.push('-');
+            len += 1;
+        }
+        pending_dash = false;
+        slug.push(c);
+        len += 1;
+        if len == MAX_SLUG_LEN {
+            break;
+        }
+    }
+
+    slug
 }
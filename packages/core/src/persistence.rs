@@ -131,8 +131,10 @@ pub fn get_project_id(project_path: &str) -> String {
 // ============================================================================
 
 /// Save global state to disk
-pub fn save_global(state: &AppState) -> Result<(), String> {
-    let persisted = GlobalPersistedState::from_app_state(state);
+///
+/// Takes the already-extracted persisted fields so callers can snapshot
+/// them under the state lock without cloning the whole `AppState`.
+pub fn save_global(persisted: &GlobalPersistedState) -> Result<(), String> {
     let path = get_global_state_path();
 
     // Ensure directory exists
@@ -141,7 +143,7 @@ pub fn save_global(state: &AppState) -> Result<(), String> {
     }
 
     // Write JSON
-    let json = serde_json::to_string_pretty(&persisted)
+    let json = serde_json::to_string_pretty(persisted)
         .map_err(|e| format!("Failed to serialize state: {}", e))?;
 
     fs::write(&path, json).map_err(|e| format!("Failed to write state: {}", e))?;
@@ -160,11 +162,8 @@ pub fn save_global(state: &AppState) -> Result<(), String> {
 pub fn load_global() -> Result<Option<GlobalPersistedState>, String> {
     let path = get_global_state_path();
 
-    if !path.exists() {
-        return Ok(None);
-    }
-
-    // Use migration manager to load and migrate
+    // Use migration manager to load and migrate (returns None if the file
+    // does not exist, so no separate exists() check here)
     let manager = MigrationManager::new();
 
     match manager.load_and_migrate(&path, true) {
@@ -189,11 +188,11 @@ pub fn load_global() -> Result<Option<GlobalPersistedState>, String> {
 pub fn load_global_raw() -> Result<Option<GlobalPersistedState>, String> {
     let path = get_global_state_path();
 
-    if !path.exists() {
-        return Ok(None);
-    }
-
-    let json = fs::read_to_string(&path).map_err(|e| format!("Failed to read state: {}", e))?;
+    let json = match fs::read_to_string(&path) {
+        Ok(json) => json,
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(None),
+        Err(e) => return Err(format!("Failed to read state: {}", e)),
+    };
 
     let persisted: GlobalPersistedState =
         serde_json::from_str(&json).map_err(|e| format!("Failed to parse state: {}", e))?;
@@ -228,12 +227,11 @@ pub fn save_project(project: &ProjectState) -> Result<(), String> {
 pub fn load_project(project_path: &str) -> Result<Option<ProjectPersistedState>, String> {
     let path = get_project_state_path(project_path);
 
-    if !path.exists() {
-        return Ok(None);
-    }
-
-    let json =
-        fs::read_to_string(&path).map_err(|e| format!("Failed to read project state: {}", e))?;
+    let json = match fs::read_to_string(&path) {
+        Ok(json) => json,
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(None),
+        Err(e) => return Err(format!("Failed to read project state: {}", e)),
+    };
 
     let persisted: ProjectPersistedState =
         serde_json::from_str(&json).map_err(|e| format!("Failed to parse project state: {}", e))?;
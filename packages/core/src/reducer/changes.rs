@@ -39,10 +39,11 @@ pub fn reduce(state: &mut AppState, action: Action) {
                         let proposal_content = std::mem::take(&mut change.streaming_output);
                         change.proposal = Some(proposal_content.clone());
                         change.status = crate::app_state::ChangeStatus::Proposed;
-                        change.updated_at = chrono::Utc::now().to_rfc3339();
+                        // One timestamp for the change and its review session
+                        let now = chrono::Utc::now().to_rfc3339();
+                        change.updated_at = now.clone();
 
                         let session_id = uuid::Uuid::new_v4().to_string();
-                        let now = chrono::Utc::now().to_rfc3339();
                         let session = crate::app_state::ReviewSession {
                             id: session_id.clone(),
                             workflow_node_id: format!("proposal-{}", change_id),
@@ -94,10 +95,11 @@ pub fn reduce(state: &mut AppState, action: Action) {
                         let plan_content = std::mem::take(&mut change.streaming_output);
                         change.plan = Some(plan_content.clone());
                         change.status = crate::app_state::ChangeStatus::Planned;
-                        change.updated_at = chrono::Utc::now().to_rfc3339();
+                        // One timestamp for the change and its review session
+                        let now = chrono::Utc::now().to_rfc3339();
+                        change.updated_at = now.clone();
 
                         let session_id = uuid::Uuid::new_v4().to_string();
-                        let now = chrono::Utc::now().to_rfc3339();
                         let session = crate::app_state::ReviewSession {
                             id: session_id.clone(),
                             workflow_node_id: format!("plan-{}", change_id),
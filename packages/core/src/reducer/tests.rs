@@ -138,6 +138,9 @@ mod tests {
         assert_eq!(change.proposal, Some("Proposal Content".to_string()));
         assert!(change.streaming_output.is_empty());
         assert!(change.proposal_review_session_id.is_some());
+        let session_id = change.proposal_review_session_id.as_ref().unwrap();
+        let session = &active_worktree(&state).tasks.review_gate.sessions[session_id];
+        assert_eq!(session.created_at, change.updated_at);
 
         // 3. Generate Plan
         reduce(&mut state, Action::GeneratePlan { change_id: "ch-1".to_string() });
@@ -152,6 +155,9 @@ mod tests {
         assert_eq!(change.plan, Some("Plan Content".to_string()));
         assert!(change.streaming_output.is_empty());
         assert!(change.plan_review_session_id.is_some());
+        let session_id = change.plan_review_session_id.as_ref().unwrap();
+        let session = &active_worktree(&state).tasks.review_gate.sessions[session_id];
+        assert_eq!(session.created_at, change.updated_at);
 
         // 4. Approve Plan (Explicit approval step)
         reduce(&mut state, Action::ApprovePlan { change_id: "ch-1".to_string() });
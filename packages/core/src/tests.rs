@@ -0,0 +1,28 @@
+use super::*;
+
+#[test]
+fn test_slugify_collapses_separators() {
+    assert_eq!(
+        slugify("Add OAuth2 login -- for GitHub!"),
+        "add-oauth2-login-for-github"
+    );
+    assert_eq!(
+        slugify("  --leading and trailing--  "),
+        "leading-and-trailing"
+    );
+    assert_eq!(slugify("!!!"), "");
+}
+
+#[test]
+fn test_slugify_caps_length() {
+    // "word-" repeated puts a separator exactly in the last slot
+    let slug = slugify(&"word ".repeat(30));
+    assert!(slug.chars().count() <= MAX_SLUG_LEN);
+    assert!(slug.starts_with("word-word-"));
+    assert!(!slug.ends_with('-'));
+}
+
+#[test]
+fn test_slugify_lowercases_unicode() {
+    assert_eq!(slugify("Ünïcode STRAßE Fix"), "ünïcode-straße-fix");
+}
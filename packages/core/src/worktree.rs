@@ -7,8 +7,13 @@
 //! - Remove worktrees
 
 use crate::actions::WorktreeData;
+use std::collections::HashMap;
 use std::path::Path;
 use std::process::Command;
+use std::sync::{Mutex, OnceLock};
+
+/// Repo roots already resolved by `get_git_root`, keyed by the checked directory
+static GIT_ROOT_CACHE: OnceLock<Mutex<HashMap<String, String>>> = OnceLock::new();
 
 /// Branch information for UI display
 #[derive(Debug, Clone)]
@@ -26,6 +31,13 @@ pub struct BranchInfo {
 /// Uses `git rev-parse --show-toplevel` to find the root.
 /// Returns None if the path is not inside a git repository.
 ///
+/// Successful lookups are cached for the lifetime of the process, so
+/// re-opening a project does not fork git again. A cached root is only
+/// reused while it still has a `.git` entry and no directory between `path`
+/// and the root has gained one (e.g. `git init` in a subdirectory), so
+/// deleted, moved or newly nested repositories fall back to git. Misses are
+/// not cached, so a directory that later becomes a repository is picked up.
+///
 /// # Arguments
 /// * `path` - Any path, can be the repo root, a subdirectory, or a file
 ///
@@ -40,6 +52,15 @@ pub fn get_git_root(path: &str) -> Option<String> {
         path
     };
 
+    let cache = GIT_ROOT_CACHE.get_or_init(|| Mutex::new(HashMap::new()));
+    let cached = cache.lock().unwrap().get(check_path).cloned();
+    if let Some(root) = cached {
+        if cached_root_is_current(Path::new(check_path), Path::new(&root)) {
+            return Some(root);
+        }
+        cache.lock().unwrap().remove(check_path);
+    }
+
     let output = Command::new("git")
         .arg("-C")
         .arg(check_path)
@@ -59,10 +80,25 @@ pub fn get_git_root(path: &str) -> Option<String> {
     if root.is_empty() {
         None
     } else {
+        cache
+            .lock()
+            .unwrap()
+            .insert(check_path.to_string(), root.clone());
         Some(root)
     }
 }
 
+/// Check that a cached repo root still applies to `check_path`.
+///
+/// A few `stat` calls are much cheaper than forking `git rev-parse`.
+fn cached_root_is_current(check_path: &Path, root: &Path) -> bool {
+    root.join(".git").exists()
+        && !check_path
+            .ancestors()
+            .take_while(|dir| *dir != root)
+            .any(|dir| dir.join(".git").exists())
+}
+
 /// Check if a path is inside any worktree of a project.
 ///
 /// # Arguments
@@ -390,6 +426,34 @@ pub fn remove_worktree(repo_path: &str, worktree_path: &str) -> Result<(), Strin
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_cached_root_is_current() {
+        let temp_dir = tempfile::TempDir::new().unwrap();
+        let root = temp_dir.path();
+        let sub_dir = root.join("src").join("nested");
+        std::fs::create_dir_all(&sub_dir).unwrap();
+        std::fs::create_dir(root.join(".git")).unwrap();
+
+        assert!(cached_root_is_current(root, root));
+        assert!(cached_root_is_current(&sub_dir, root));
+
+        // `git init` in a subdirectory makes that the nearer root
+        std::fs::create_dir(root.join("src").join(".git")).unwrap();
+        assert!(!cached_root_is_current(&sub_dir, root));
+        assert!(cached_root_is_current(root, root));
+    }
+
+    #[test]
+    fn test_cached_root_is_current_repo_removed() {
+        let temp_dir = tempfile::TempDir::new().unwrap();
+        let root = temp_dir.path();
+        std::fs::create_dir(root.join(".git")).unwrap();
+        assert!(cached_root_is_current(root, root));
+
+        std::fs::remove_dir(root.join(".git")).unwrap();
+        assert!(!cached_root_is_current(root, root));
+    }
+
     #[test]
     fn test_parse_single_worktree() {
         let output = "/Users/chris/projects/rustation  abc1234 [main]";